@@ -4,17 +4,27 @@ This application implements security best practices for a paper search system.
 """
 
 import os
+import re
+import sys
 import logging
 from datetime import timedelta
-from flask import Flask, render_template, request, jsonify, session
-from flask_wtf.csrf import CSRFProtect
-from flask_limiter import Limiter
-from flask_limiter.util import get_remote_address
-from flask_talisman import Talisman
 import secrets
 
-# Import mock data (replace with actual database in production)
-from mock_data import get_all_papers, search_papers
+import startup_profile
+
+with startup_profile.track('import', 'flask'):
+    from flask import (
+        Blueprint, Flask, current_app, render_template, request, jsonify
+    )
+with startup_profile.track('import', 'flask_wtf'):
+    from flask_wtf.csrf import CSRFProtect
+with startup_profile.track('import', 'flask_limiter'):
+    from flask_limiter import Limiter
+    from flask_limiter.util import get_remote_address
+with startup_profile.track('import', 'flask_talisman'):
+    from flask_talisman import Talisman
+with startup_profile.track('import', 'page_cache'):
+    from page_cache import RenderedPageCache
 
 # Configure logging
 logging.basicConfig(
@@ -23,8 +33,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Initialize Flask app
-app = Flask(__name__)
+# Routes, handlers and hooks live on a blueprint so that the Flask app
+# itself is only built when create_app() is called
+bp = Blueprint('portal', __name__)
 
 # ============================================================================
 # SECURITY CONFIGURATION
@@ -47,24 +58,30 @@ class SecurityConfig:
     WTF_CSRF_TIME_LIMIT = None  # No time limit on CSRF tokens
     WTF_CSRF_SSL_STRICT = True  # Require HTTPS for CSRF
     
+    # Rate limiting - set explicitly because the shared limiter otherwise
+    # keeps the value from the previous app built in this process
+    RATELIMIT_ENABLED = True
+    
     # Prevent old password vulnerabilities
     SESSION_REFRESH_EACH_REQUEST = True
     
     # File upload security (if needed in future)
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file size
 
-app.config.from_object(SecurityConfig)
-
 # ============================================================================
 # SECURITY MIDDLEWARE
 # ============================================================================
 
+# Extensions are created unbound and attached to the app in create_app().
+# The limiter keeps its settings and storage on the instance and is shared
+# by every app built in the process; RATELIMIT_ENABLED is set in every
+# config so one app cannot switch rate limiting off for the next.
+
 # CSRF Protection
-csrf = CSRFProtect(app)
+csrf = CSRFProtect()
 
 # Rate Limiting
 limiter = Limiter(
-    app=app,
     key_func=get_remote_address,
     default_limits=["200 per day", "50 per hour"],
     storage_uri="memory://"
@@ -96,30 +113,35 @@ csp = {
     'form-action': "'self'"
 }
 
-# Talisman for HTTPS enforcement and security headers
-# Configure based on environment
-is_production = os.environ.get('FLASK_ENV') == 'production'
-
-talisman = Talisman(
-    app,
-    force_https=is_production,  # Only force HTTPS in production
-    strict_transport_security=is_production,
-    strict_transport_security_max_age=31536000 if is_production else 0,
-    content_security_policy=csp,
-    content_security_policy_nonce_in=['script-src'],
-    referrer_policy='strict-origin-when-cross-origin',
-    feature_policy={
-        'geolocation': "'none'",
-        'microphone': "'none'",
-        'camera': "'none'"
-    }
-)
+def init_talisman(app):
+    """
+    Attach Talisman to the app, configured based on environment
+
+    Talisman stores its settings on the instance, so each app gets its own.
+    """
+    is_production = os.environ.get('FLASK_ENV') == 'production'
+
+    # Talisman for HTTPS enforcement and security headers
+    app.extensions['talisman'] = Talisman(
+        app,
+        force_https=is_production,  # Only force HTTPS in production
+        strict_transport_security=is_production,
+        strict_transport_security_max_age=31536000 if is_production else 0,
+        content_security_policy=csp,
+        content_security_policy_nonce_in=['script-src'],
+        referrer_policy='strict-origin-when-cross-origin',
+        feature_policy={
+            'geolocation': "'none'",
+            'microphone': "'none'",
+            'camera': "'none'"
+        }
+    )
 
 # ============================================================================
 # ADDITIONAL SECURITY HEADERS
 # ============================================================================
 
-@app.after_request
+@bp.after_app_request
 def set_additional_security_headers(response):
     """Add additional security headers to all responses"""
     
@@ -157,6 +179,9 @@ def set_additional_security_headers(response):
 # INPUT VALIDATION
 # ============================================================================
 
+# Compiled once at import instead of on every validation call
+SEARCH_QUERY_PATTERN = re.compile(r'^[a-zA-Z0-9\s\-_.]+$')
+
 def validate_search_query(query):
     """
     Validate search query to prevent injection attacks
@@ -178,8 +203,7 @@ def validate_search_query(query):
         return False, "Search query too short (min 2 characters)"
     
     # Character validation - allow alphanumeric, spaces, and basic punctuation
-    import re
-    if not re.match(r'^[a-zA-Z0-9\s\-_.]+$', query):
+    if not SEARCH_QUERY_PATTERN.match(query):
         return False, "Invalid characters in search query"
     
     # Sanitize by stripping whitespace
@@ -188,29 +212,59 @@ def validate_search_query(query):
     logger.info(f"Search query validated: {sanitized}")
     return True, sanitized
 
+def validate_int_param(value, name, minimum, maximum):
+    """
+    Validate an optional integer query parameter
+    
+    Args:
+        value (str): Raw parameter value (may be empty)
+        name (str): Parameter name for error messages
+        minimum (int): Smallest allowed value
+        maximum (int): Largest allowed value
+        
+    Returns:
+        tuple: (is_valid, int value or None, or error_message)
+    """
+    if not value:
+        return True, None
+    
+    # isdigit() would accept characters such as '²' that int() rejects
+    if not (value.isascii() and value.isdecimal()):
+        return False, f"{name} must be a number"
+    
+    try:
+        number = int(value)
+    except ValueError:  # Longer than int()'s digit limit
+        return False, f"{name} must be a number"
+    
+    if not minimum <= number <= maximum:
+        return False, f"{name} must be between {minimum} and {maximum}"
+    
+    return True, number
+
 # ============================================================================
 # ERROR HANDLERS
 # ============================================================================
 
-@app.errorhandler(404)
+@bp.app_errorhandler(404)
 def not_found_error(error):
     """Handle 404 errors"""
     logger.warning(f"404 error: {request.url}")
     return render_template('404.html'), 404
 
-@app.errorhandler(500)
+@bp.app_errorhandler(500)
 def internal_error(error):
     """Handle 500 errors"""
     logger.error(f"500 error: {error}")
     return render_template('500.html'), 500
 
-@app.errorhandler(429)
+@bp.app_errorhandler(429)
 def ratelimit_handler(error):
     """Handle rate limit exceeded"""
     logger.warning(f"Rate limit exceeded from {get_remote_address()}")
     return jsonify(error="Rate limit exceeded. Please try again later."), 429
 
-@app.errorhandler(403)
+@bp.app_errorhandler(403)
 def forbidden_error(error):
     """Handle 403 errors"""
     logger.warning(f"403 error: {request.url}")
@@ -220,26 +274,26 @@ def forbidden_error(error):
 # ROUTES
 # ============================================================================
 
-@app.route('/')
+@bp.route('/')
 def index():
     """Render the main page"""
     try:
-        return render_template('index.html')
+        return render_cached_page('index.html')
     except Exception as e:
         logger.error(f"Error rendering index: {e}")
         return "An error occurred", 500
 
-@app.route('/offline')
+@bp.route('/offline')
 @limiter.exempt  # Offline page should not be rate limited
 def offline():
     """Render the offline page for PWA offline support"""
     try:
-        return render_template('offline.html')
+        return render_cached_page('offline.html')
     except Exception as e:
         logger.error(f"Error rendering offline page: {e}")
         return "An error occurred", 500
 
-@app.route('/search', methods=['POST'])
+@bp.route('/search', methods=['POST'])
 @limiter.limit("10 per minute")  # Strict rate limit for search
 def search():
     """
@@ -278,34 +332,37 @@ def search():
         logger.error(f"Search error: {e}")
         return jsonify(error="An error occurred while searching"), 500
 
-@app.route('/health')
+@bp.route('/health')
 @limiter.exempt  # Health check should not be rate limited
 def health():
     """Health check endpoint"""
     return jsonify(status="healthy"), 200
 
-@app.route('/manifest.json')
+@bp.route('/manifest.json')
 @limiter.exempt
 def manifest():
     """Serve PWA manifest"""
-    return app.send_static_file('manifest.json')
+    return current_app.send_static_file('manifest.json')
 
-@app.route('/sw.js')
+@bp.route('/sw.js')
 @limiter.exempt
 def service_worker():
     """Serve service worker"""
-    response = app.send_static_file('sw.js')
+    response = current_app.send_static_file('sw.js')
     response.headers['Service-Worker-Allowed'] = '/'
     return response
 
-@app.route('/api/papers', methods=['GET'])
+@bp.route('/api/papers', methods=['GET'])
 @limiter.limit("30 per minute")
 def get_papers_api():
     """
-    Get all papers or search papers
+    Get all papers, search papers or filter them by year and semester
     
     Query parameters:
         q (str): Optional search query
+        year_from (int): Optional inclusive lower bound on exam year
+        year_to (int): Optional inclusive upper bound on exam year
+        semester (int): Optional semester
     
     Returns:
         JSON response with papers list
@@ -313,17 +370,39 @@ def get_papers_api():
     try:
         query = request.args.get('q', '').strip()
         
+        filters = {}
+        for name, minimum, maximum in (
+            ('year_from', 1900, 2100),
+            ('year_to', 1900, 2100),
+            ('semester', 1, 12),
+        ):
+            is_valid, result = validate_int_param(
+                request.args.get(name, '').strip(), name, minimum, maximum
+            )
+            if not is_valid:
+                return jsonify(error=result), 400
+            if result is not None:
+                filters[name] = result
+        
+        if filters.get('year_from', 0) > filters.get('year_to', 2100):
+            return jsonify(error="year_from must not be after year_to"), 400
+        
         # Get papers from mock data (replace with actual database query in production)
+        catalog = get_catalog()
         if query:
             is_valid, result = validate_search_query(query)
             if not is_valid:
                 return jsonify(error=result), 400
-            
-            papers = search_papers(result)
+            query = result
+        
+        if filters:
+            papers = catalog.filter_papers(query or None, **filters)
+        elif query:
+            papers = catalog.search_papers(query)
         else:
-            papers = get_all_papers()
+            papers = catalog.get_all_papers()
         
-        logger.info(f"Papers API called with query: '{query}', results: {len(papers)}")
+        logger.info(f"Papers API called with query: '{query}', filters: {filters}, results: {len(papers)}")
         return jsonify(papers), 200
         
     except Exception as e:
@@ -338,11 +417,112 @@ def generate_nonce():
     """Generate a nonce for CSP"""
     return secrets.token_urlsafe(16)
 
-@app.context_processor
+@bp.app_context_processor
 def inject_nonce():
     """Inject nonce into templates for CSP"""
     return dict(csp_nonce=generate_nonce)
 
+PAGE_CACHE_LOG_INTERVAL = 1000
+
+def render_cached_page(template_name):
+    """
+    Render a static page from the rendered-page cache
+
+    The cached HTML holds a placeholder that is replaced with this
+    request's CSP nonce, so the page matches the CSP header.
+
+    Args:
+        template_name (str): Template to render
+
+    Returns:
+        str: Rendered HTML
+    """
+    cache = current_app.extensions['page_cache']
+    nonce = getattr(request, 'csp_nonce', None) or generate_nonce()
+    misses = cache.misses
+    html = cache.render(template_name, nonce)
+    
+    # Report render time saved whenever a page is (re)rendered and
+    # every PAGE_CACHE_LOG_INTERVAL cache hits
+    if cache.misses != misses or cache.hits % PAGE_CACHE_LOG_INTERVAL == 0:
+        logger.info("Page cache stats: %s", cache.stats())
+    return html
+
+# ============================================================================
+# PAPER CATALOG
+# ============================================================================
+
+_catalog = None
+
+def get_catalog():
+    """
+    Get the paper catalog, loading it on first use
+
+    Returns:
+        module: Catalog exposing get_all_papers(), search_papers() and
+            filter_papers()
+    """
+    global _catalog
+    if _catalog is None:
+        with startup_profile.track('init', 'catalog'):
+            # Import mock data (replace with actual database in production)
+            import mock_data
+            _catalog = mock_data
+    return _catalog
+
+# ============================================================================
+# APPLICATION FACTORY
+# ============================================================================
+
+def create_app(config_object=SecurityConfig):
+    """
+    Build and configure the Flask application
+
+    Args:
+        config_object: Object to load configuration from
+
+    Returns:
+        Flask: Configured application
+    """
+    # Report only this app's initialization, not that of earlier apps
+    startup_profile.reset('init')
+
+    with startup_profile.track('init', 'flask app'):
+        app = Flask(__name__)
+        app.config.from_object(config_object)
+
+    with startup_profile.track('init', 'csrf'):
+        csrf.init_app(app)
+
+    with startup_profile.track('init', 'limiter'):
+        limiter.init_app(app)
+
+    with startup_profile.track('init', 'talisman'):
+        init_talisman(app)
+
+    with startup_profile.track('init', 'routes'):
+        app.register_blueprint(bp)
+        app.extensions['page_cache'] = RenderedPageCache()
+
+    # Startup profiling: report import and initialization time per component.
+    # Runs here so it also works under gunicorn, not just python app.py.
+    if startup_profile.enabled():
+        get_catalog()
+        logger.info("Startup profile:\n%s", startup_profile.format_report())
+
+    return app
+
+_app = None
+
+def __getattr__(name):
+    """Build the module-level app on first access (e.g. gunicorn app:app)"""
+    global _app
+    if name == 'app':
+        if _app is None:
+            _app = create_app()
+        return _app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 # ============================================================================
 # APPLICATION STARTUP
 # ============================================================================
@@ -356,6 +536,14 @@ if __name__ == '__main__':
             "Set SECRET_KEY environment variable."
         )
     
+    # Report startup timings and exit without serving
+    if '--profile-startup' in sys.argv:
+        os.environ['STARTUP_PROFILE'] = '1'
+        create_app()
+        sys.exit(0)
+
+    app = create_app()
+
     # Development settings
     # In production, use a proper WSGI server like Gunicorn
     debug_mode = os.environ.get('FLASK_ENV') == 'development'
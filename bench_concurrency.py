@@ -0,0 +1,142 @@
+"""
+Concurrency Benchmark
+Compares /api/papers throughput under gunicorn sync workers and the same
+app served by Uvicorn through asgiref's WsgiToAsgi bridge, at increasing
+numbers of concurrent connections.
+
+This is the measurement behind not shipping an ASGI serving mode: the
+bridge runs every request on a thread anyway and is slower than gunicorn
+(see DEPLOYMENT_GUIDE.md).
+
+Usage:
+    pip install uvicorn asgiref
+    python bench_concurrency.py [--workers 4] [--requests 400]
+
+Servers whose packages are not installed are skipped. Rate limiting is
+disabled for the benchmark app so that throughput, not the limiter, is
+measured.
+"""
+
+import argparse
+import importlib.util
+import os
+import subprocess
+import sys
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from app import SecurityConfig, create_app
+
+PATH = '/api/papers?q=mca'
+CONCURRENCY_LEVELS = [1, 10, 50, 100]
+
+
+class BenchConfig(SecurityConfig):
+    """Production config with rate limiting turned off"""
+    RATELIMIT_ENABLED = False
+
+
+def create_bench_app():
+    """WSGI factory used by gunicorn"""
+    return create_app(BenchConfig)
+
+
+def create_bench_asgi():
+    """ASGI factory used by uvicorn"""
+    from asgiref.wsgi import WsgiToAsgi
+    return WsgiToAsgi(create_bench_app())
+
+
+# name -> (required packages, command builder)
+SERVERS = {
+    'gunicorn-sync': (['gunicorn'], lambda port, workers: [
+        sys.executable, '-m', 'gunicorn', '-w', str(workers), '-k', 'sync',
+        '-b', f'127.0.0.1:{port}', 'bench_concurrency:create_bench_app()'
+    ]),
+    'uvicorn-asgi': (['uvicorn', 'asgiref'], lambda port, workers: [
+        sys.executable, '-m', 'uvicorn', '--factory', '--workers', str(workers),
+        '--host', '127.0.0.1', '--port', str(port), '--log-level', 'warning',
+        'bench_concurrency:create_bench_asgi'
+    ]),
+}
+
+
+def wait_until_ready(base_url, timeout=15):
+    """Poll /health until the server answers"""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with urllib.request.urlopen(base_url + '/health', timeout=1):
+                return True
+        except OSError:
+            time.sleep(0.1)
+    return False
+
+
+def fetch(url):
+    """Make one request and return its status code (0 on failure)"""
+    try:
+        with urllib.request.urlopen(url, timeout=30) as response:
+            response.read()
+            return response.status
+    except OSError:
+        return 0
+
+
+def measure(url, concurrency, total):
+    """
+    Send total requests with the given number of concurrent connections
+
+    Returns:
+        tuple: (requests per second, number of failed requests)
+    """
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        statuses = list(pool.map(fetch, [url] * total))
+    elapsed = time.perf_counter() - start
+    return total / elapsed, sum(1 for s in statuses if s != 200)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--requests', type=int, default=400)
+    parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args()
+
+    env = dict(os.environ, FLASK_ENV='benchmark')
+    results = {}
+    for name, (packages, command) in SERVERS.items():
+        missing = [p for p in packages if importlib.util.find_spec(p) is None]
+        if missing:
+            print(f"⚠ Skipping {name}: {', '.join(missing)} not installed")
+            continue
+        base_url = f'http://127.0.0.1:{args.port}'
+        server = subprocess.Popen(
+            command(args.port, args.workers), env=env,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        try:
+            if not wait_until_ready(base_url):
+                print(f"✗ {name} did not start")
+                continue
+            results[name] = [
+                measure(base_url + PATH, level, args.requests)
+                for level in CONCURRENCY_LEVELS
+            ]
+        finally:
+            server.terminate()
+            server.wait()
+
+    print(f"{'server':<16}" + ''.join(f"{f'c={n}':>15}" for n in CONCURRENCY_LEVELS))
+    for name, rows in results.items():
+        cells = ''.join(
+            f"{rps:>9.0f} req/s" if not failed else f"{rps:>5.0f} ({failed:>3} err)"
+            for rps, failed in rows
+        )
+        print(f"{name:<16}{cells}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,26 @@
+"""
+Shared pytest fixtures
+"""
+
+import pytest
+
+from app import SecurityConfig, create_app
+
+
+class TestConfig(SecurityConfig):
+    """Test config with CSRF and rate limiting turned off"""
+    TESTING = True
+    WTF_CSRF_ENABLED = False
+    RATELIMIT_ENABLED = False
+
+
+@pytest.fixture
+def app():
+    """Application built with the test config"""
+    return create_app(TestConfig)
+
+
+@pytest.fixture
+def client(app):
+    """Test client for the application"""
+    return app.test_client()
@@ -3,6 +3,8 @@ Mock data for development and testing
 Replace with actual database queries in production
 """
 
+from bisect import bisect_left, bisect_right
+
 # Mock papers database
 MOCK_PAPERS = [
     {
@@ -63,6 +65,63 @@ MOCK_PAPERS = [
     }
 ]
 
+# Sorted secondary indexes over MOCK_PAPERS, built on first use.
+# Each maps a field to parallel lists of sorted keys and paper positions.
+#
+# These indexes are the only backing for the year/semester range filters.
+# The SQLite papers table (database.py) still stores semester and
+# exam_year as TEXT with no indexes: uploads send semesters as Roman
+# numerals ("I", "II", ... "All Semesters") and nothing reads the table
+# yet. Moving the catalog to SQLite needs INTEGER columns, a mapping for
+# those semester values and B-tree indexes before filter_papers() can be
+# ported.
+_indexes = None
+
+def _get_indexes():
+    """Build the exam_year and semester indexes once"""
+    global _indexes
+    if _indexes is None:
+        _indexes = {}
+        for field in ('exam_year', 'semester'):
+            pairs = sorted((int(p[field]), i) for i, p in enumerate(MOCK_PAPERS))
+            _indexes[field] = ([key for key, _ in pairs], [i for _, i in pairs])
+    return _indexes
+
+def _range_positions(field, low=None, high=None):
+    """
+    Find paper positions whose field lies in [low, high] in O(log N + k)
+
+    Args:
+        field (str): Indexed field ('exam_year' or 'semester')
+        low (int): Inclusive lower bound, or None for unbounded
+        high (int): Inclusive upper bound, or None for unbounded
+
+    Returns:
+        set: Positions in MOCK_PAPERS
+    """
+    keys, positions = _get_indexes()[field]
+    start = 0 if low is None else bisect_left(keys, low)
+    end = len(keys) if high is None else bisect_right(keys, high)
+    return set(positions[start:end])
+
+def _query_positions(query):
+    """
+    Find paper positions matching a text query
+    
+    Subject and class are matched by substring; numeric queries match
+    exam_year exactly through the index.
+    """
+    query_lower = query.lower()
+    positions = {
+        i for i, p in enumerate(MOCK_PAPERS)
+        if query_lower in p['subject'].lower()
+        or query_lower in p['class'].lower()
+    }
+    # isdigit() would accept characters such as '²' that int() rejects
+    if query.isascii() and query.isdecimal():
+        positions |= _range_positions('exam_year', int(query), int(query))
+    return positions
+
 def get_all_papers():
     """Get all papers from mock database"""
     return MOCK_PAPERS.copy()
@@ -80,10 +139,32 @@ def search_papers(query):
     if not query:
         return MOCK_PAPERS.copy()
     
-    query_lower = query.lower()
-    return [
-        p for p in MOCK_PAPERS 
-        if query_lower in p['subject'].lower() 
-        or query_lower in p['class'].lower()
-        or query_lower in str(p['exam_year'])
-    ]
+    return [MOCK_PAPERS[i] for i in sorted(_query_positions(query))]
+
+def filter_papers(query=None, year_from=None, year_to=None, semester=None):
+    """
+    Filter papers by year range and semester, optionally with a text query
+    
+    Args:
+        query (str): Optional search query (case-insensitive)
+        year_from (int): Optional inclusive lower bound on exam_year
+        year_to (int): Optional inclusive upper bound on exam_year
+        semester (int): Optional exact semester
+    
+    Returns:
+        list: Papers matching all given filters
+    """
+    positions = None
+    if year_from is not None or year_to is not None:
+        positions = _range_positions('exam_year', year_from, year_to)
+    if semester is not None:
+        semester_positions = _range_positions('semester', semester, semester)
+        positions = semester_positions if positions is None else positions & semester_positions
+    
+    if query:
+        query_positions = _query_positions(query)
+        positions = query_positions if positions is None else positions & query_positions
+    
+    if positions is None:
+        return MOCK_PAPERS.copy()
+    return [MOCK_PAPERS[i] for i in sorted(positions)]
@@ -0,0 +1,113 @@
+"""
+Rendered page cache
+Renders a static template once with a placeholder in place of the CSP
+nonce, then splices a fresh nonce into the cached HTML for each response.
+
+Cached templates may only vary per request by csp_nonce(). Anything else
+(csrf_token(), session, request.args, ...) would be frozen at the first
+visitor's value and served to everyone, so render() refuses templates
+that use the per-request globals in UNCACHEABLE_GLOBALS.
+"""
+
+import os
+import threading
+import time
+
+from flask import current_app, render_template, request
+from jinja2 import nodes
+
+# Rendered in place of the nonce and replaced on every response
+NONCE_PLACEHOLDER = '__csp_nonce_placeholder__'
+
+# Template globals whose values differ between requests or visitors
+UNCACHEABLE_GLOBALS = frozenset({
+    'csrf_token', 'session', 'request', 'g', 'get_flashed_messages',
+})
+
+
+class RenderedPageCache:
+    """Cache of rendered template output keyed by template name"""
+
+    def __init__(self):
+        self._pages = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.render_time_saved = 0.0
+
+    def render(self, template_name, nonce):
+        """
+        Render a template from cache, inserting the given nonce
+
+        Args:
+            template_name (str): Template to render
+            nonce (str): CSP nonce for this response
+
+        Returns:
+            str: Rendered HTML
+
+        Raises:
+            ValueError: If the template uses a per-request global
+        """
+        key = (template_name, request.script_root)
+        entry = self._pages.get(key)
+
+        if entry is None or self._is_stale(template_name, entry):
+            self._check_cacheable(template_name)
+            # Load (and compile) first so only the render itself is timed
+            current_app.jinja_env.get_template(template_name)
+            start = time.perf_counter()
+            html = render_template(template_name, csp_nonce=lambda: NONCE_PLACEHOLDER)
+            elapsed = time.perf_counter() - start
+            entry = (html, elapsed, self._source_mtime(template_name))
+            with self._lock:
+                self._pages[key] = entry
+                self.misses += 1
+        else:
+            with self._lock:
+                self.hits += 1
+                self.render_time_saved += entry[1]
+
+        return entry[0].replace(NONCE_PLACEHOLDER, nonce)
+
+    def stats(self):
+        """
+        Get cache statistics
+
+        Returns:
+            dict: Hits, misses and total render time saved in milliseconds
+        """
+        return {
+            'pages': len(self._pages),
+            'hits': self.hits,
+            'misses': self.misses,
+            'render_time_saved_ms': round(self.render_time_saved * 1000, 3),
+        }
+
+    def _is_stale(self, template_name, entry):
+        """Check whether a template changed on disk (development only)"""
+        if not current_app.jinja_env.auto_reload:
+            return False
+        return entry[2] != self._source_mtime(template_name)
+
+    @staticmethod
+    def _check_cacheable(template_name):
+        """Refuse templates that would freeze per-request values"""
+        env = current_app.jinja_env
+        source = env.loader.get_source(env, template_name)[0]
+        # meta.find_undeclared_variables() skips environment globals such as
+        # csrf_token and session, so look at every name the template reads
+        names = {node.name for node in env.parse(source).find_all(nodes.Name)}
+        used = names & UNCACHEABLE_GLOBALS
+        if used:
+            raise ValueError(
+                f"{template_name} uses {', '.join(sorted(used))} and cannot be cached"
+            )
+
+    @staticmethod
+    def _source_mtime(template_name):
+        """Get the modification time of a template file, if it has one"""
+        template = current_app.jinja_env.get_template(template_name)
+        if template.filename and os.path.exists(template.filename):
+            return os.path.getmtime(template.filename)
+        return None
@@ -0,0 +1,59 @@
+"""
+Startup profiling for the Flask application
+Records how long each import and initialization step takes during boot
+"""
+
+import os
+import time
+from contextlib import contextmanager
+
+# (phase, component, seconds) in the order they were recorded
+_timings = []
+
+
+@contextmanager
+def track(phase, component):
+    """
+    Time a block of startup work
+
+    Args:
+        phase (str): 'import' or 'init'
+        component (str): Name of the component being loaded
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _timings.append((phase, component, time.perf_counter() - start))
+
+
+def format_report():
+    """
+    Format recorded timings as a plain-text table
+
+    Returns:
+        str: One line per component followed by per-phase totals
+    """
+    lines = [f"{'phase':<8} {'component':<24} {'ms':>9}"]
+    totals = {}
+    for phase, component, seconds in _timings:
+        lines.append(f"{phase:<8} {component:<24} {seconds * 1000:>9.2f}")
+        totals[phase] = totals.get(phase, 0.0) + seconds
+    for phase, seconds in totals.items():
+        lines.append(f"{phase:<8} {'(total)':<24} {seconds * 1000:>9.2f}")
+    return "\n".join(lines)
+
+
+def reset(phase):
+    """
+    Drop recorded timings for one phase
+
+    Args:
+        phase (str): 'import' or 'init'
+    """
+    _timings[:] = [t for t in _timings if t[0] != phase]
+
+
+def enabled():
+    """Check whether startup profiling was requested (STARTUP_PROFILE=1)"""
+    return os.environ.get('STARTUP_PROFILE') == '1'
@@ -0,0 +1,16 @@
+"""
+Tests for the application factory
+"""
+
+from app import create_app
+
+
+def test_default_app_is_rate_limited_after_test_app(app):
+    # The app fixture is built with rate limiting turned off
+    default_app = create_app()
+    client = default_app.test_client()
+
+    statuses = [client.get('/api/papers').status_code for _ in range(31)]
+
+    assert statuses[:30] == [200] * 30
+    assert statuses[30] == 429
@@ -0,0 +1,69 @@
+"""
+Tests for the rendered page cache and per-response CSP nonce
+"""
+
+import os
+import re
+
+import pytest
+from jinja2 import ChoiceLoader, FileSystemLoader
+
+NONCE_PAGE = '<script nonce="{{ csp_nonce() }}"></script>{{ version }}'
+
+
+@pytest.fixture
+def template_dir(app, tmp_path):
+    """Serve index.html from a temporary directory ahead of templates/"""
+    app.jinja_env.loader = ChoiceLoader([
+        FileSystemLoader(str(tmp_path)), app.jinja_env.loader
+    ])
+    return tmp_path
+
+
+def write_template(template_dir, source, mtime):
+    path = template_dir / 'index.html'
+    path.write_text(source)
+    os.utime(path, (mtime, mtime))
+
+
+def page_nonce(response):
+    return re.search(r'nonce="([^"]+)"', response.get_data(as_text=True)).group(1)
+
+
+def test_nonce_matches_csp_header_and_is_fresh(client, template_dir):
+    write_template(template_dir, NONCE_PAGE, 1_000_000)
+
+    first = client.get('/')
+    second = client.get('/')
+
+    for response in (first, second):
+        assert response.status_code == 200
+        assert f"'nonce-{page_nonce(response)}'" in response.headers['Content-Security-Policy']
+    assert page_nonce(first) != page_nonce(second)
+    assert client.application.extensions['page_cache'].stats()['hits'] == 1
+
+
+def test_rerenders_when_template_changes_with_auto_reload(app, client, template_dir):
+    app.jinja_env.auto_reload = True
+    write_template(template_dir, NONCE_PAGE.replace('{{ version }}', 'v1'), 1_000_000)
+    assert 'v1' in client.get('/').get_data(as_text=True)
+
+    write_template(template_dir, NONCE_PAGE.replace('{{ version }}', 'v2'), 2_000_000)
+    assert 'v2' in client.get('/').get_data(as_text=True)
+    assert app.extensions['page_cache'].stats()['misses'] == 2
+
+
+def test_keeps_cached_page_without_auto_reload(app, client, template_dir):
+    app.jinja_env.auto_reload = False
+    write_template(template_dir, 'v1', 1_000_000)
+    client.get('/')
+
+    write_template(template_dir, 'v2', 2_000_000)
+    assert client.get('/').get_data(as_text=True) == 'v1'
+
+
+def test_refuses_templates_with_per_request_values(app, client, template_dir):
+    write_template(template_dir, '<input value="{{ csrf_token() }}">', 1_000_000)
+
+    assert client.get('/').status_code == 500
+    assert app.extensions['page_cache'].stats()['pages'] == 0
@@ -0,0 +1,87 @@
+"""
+Tests for the year range and semester filters on the papers catalog and API
+"""
+
+import pytest
+
+from mock_data import MOCK_PAPERS, filter_papers, search_papers
+
+
+def subjects(papers):
+    return [p['subject'] for p in papers]
+
+
+# ============================================================================
+# CATALOG INDEXES
+# ============================================================================
+
+def test_single_year_range_includes_both_bounds():
+    papers = filter_papers(year_from=2024, year_to=2024)
+    assert subjects(papers) == ['Computer Networks', 'Chemistry', 'Database Management']
+
+
+def test_open_ended_ranges():
+    assert all(p['exam_year'] >= 2025 for p in filter_papers(year_from=2025))
+    assert len(filter_papers(year_from=2025)) == 4
+    assert subjects(filter_papers(year_to=2023)) == ['History']
+
+
+def test_range_outside_data_is_empty():
+    assert filter_papers(year_from=2026) == []
+    assert filter_papers(year_to=2022) == []
+
+
+def test_semester_combined_with_range():
+    papers = filter_papers(year_from=2024, semester=2)
+    assert subjects(papers) == ['Computer Networks', 'Chemistry']
+
+
+def test_query_combined_with_range():
+    papers = filter_papers(query='MCA', year_from=2024, year_to=2024)
+    assert subjects(papers) == ['Computer Networks', 'Database Management']
+
+
+def test_results_keep_catalog_order():
+    papers = filter_papers(year_from=2023)
+    assert papers == MOCK_PAPERS
+
+
+def test_numeric_query_matches_year_exactly():
+    assert subjects(search_papers('2023')) == ['History']
+    assert search_papers('202') == []
+
+
+def test_non_ascii_digit_query_is_text_only():
+    assert search_papers('²') == []
+
+
+# ============================================================================
+# /api/papers
+# ============================================================================
+
+def test_api_filters(client):
+    response = client.get('/api/papers?year_from=2024&year_to=2024&semester=3')
+    assert response.status_code == 200
+    assert subjects(response.get_json()) == ['Database Management']
+
+
+def test_api_query_with_range(client):
+    response = client.get('/api/papers?q=BSc&year_to=2024')
+    assert response.status_code == 200
+    assert subjects(response.get_json()) == ['Chemistry']
+
+
+@pytest.mark.parametrize('query_string, error', [
+    ('year_from=abc', 'year_from must be a number'),
+    ('year_from=%C2%B2', 'year_from must be a number'),
+    ('year_to=-1', 'year_to must be a number'),
+    ('year_to=' + '1' * 5000, 'year_to must be a number'),
+    ('year_from=20245', 'year_from must be between 1900 and 2100'),
+    ('semester=0', 'semester must be between 1 and 12'),
+    ('year_from=2025&year_to=2024', 'year_from must not be after year_to'),
+    ('q=%3Cscript%3E&year_from=2024', 'Invalid characters in search query'),
+])
+def test_api_rejects_invalid_filters(client, query_string, error):
+    response = client.get('/api/papers?' + query_string)
+    assert response.status_code == 400
+    assert response.get_json() == {'error': error}